@@ -0,0 +1,31 @@
+# Generated by Django 4.1.7 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("relay", "0031_auto_20211119_1541"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="safecreation2",
+            index=models.Index(
+                condition=models.Q(("tx_hash__isnull", False)),
+                fields=["block_number"],
+                name="sc2_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="safefunding",
+            index=models.Index(
+                fields=["safe_deployed", "deployer_funded"],
+                name="sf_deployed_funded_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="safemultisigtx",
+            index=models.Index(fields=["safe", "-nonce"], name="smtx_safe_nonce_idx"),
+        ),
+    ]
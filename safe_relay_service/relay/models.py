@@ -1,10 +1,10 @@
 import datetime
 from datetime import timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
+from django.db import models, transaction
 from django.db.models import (
     Avg,
     Case,
@@ -21,7 +21,6 @@ from django.db.models.expressions import RawSQL, Subquery, Window
 from django.db.models.functions import Cast, TruncDate
 from django.utils import timezone
 
-from hexbytes import HexBytes
 from model_utils.models import TimeStampedModel
 from web3.types import TxParams
 
@@ -33,6 +32,8 @@ from gnosis.safe.safe_signature import SafeSignature
 
 from .models_raw import SafeContractManagerRaw, SafeContractQuerySetRaw
 
+SAFE_OPERATION_CHOICES = tuple((tag.value, tag.name) for tag in SafeOperation)
+
 
 class EthereumTxType(Enum):
     CALL = 0
@@ -60,12 +61,14 @@ class EthereumTxCallType(Enum):
     def parse_call_type(call_type: str):
         if not call_type:
             return None
-        elif call_type.lower() == "call":
-            return EthereumTxCallType.CALL
-        elif call_type.lower() == "delegatecall":
-            return EthereumTxCallType.DELEGATE_CALL
-        else:
-            return None
+        return _CALL_TYPES_BY_NAME.get(call_type.lower())
+
+
+# Defined outside the Enum, otherwise it would become a member
+_CALL_TYPES_BY_NAME = {
+    "call": EthereumTxCallType.CALL,
+    "delegatecall": EthereumTxCallType.DELEGATE_CALL,
+}
 
 
 class SafeContractManager(SafeContractManagerRaw):
@@ -177,6 +180,7 @@ class SafeCreation2QuerySet(models.QuerySet):
                 block_number=None,
             )
             .select_related("safe")
+            .defer("setup_data")  # Not needed to check the deployment, and can be big
         )
 
 
@@ -203,6 +207,13 @@ class SafeCreation2(TimeStampedModel):
 
     class Meta:
         verbose_name_plural = "Safe creation2s"
+        indexes = [
+            models.Index(
+                fields=["block_number"],
+                condition=Q(tx_hash__isnull=False),
+                name="sc2_pending_idx",
+            ),
+        ]
 
     def __str__(self):
         if self.block_number:
@@ -260,38 +271,55 @@ class SafeFunding(TimeStampedModel):
     # We could use SafeCreation.tx_hash, but we would run into troubles because of Ganache
     safe_deployed_tx_hash = Sha3HashField(unique=True, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["safe_deployed", "deployer_funded"],
+                name="sf_deployed_funded_idx",
+            ),
+        ]
+
     def is_all_funded(self):
         return self.safe_funded and self.deployer_funded
 
+    def _status_key(self) -> int:
+        return (
+            bool(self.safe_deployed) << 4
+            | bool(self.safe_deployed_tx_hash) << 3
+            | bool(self.deployer_funded) << 2
+            | bool(self.deployer_funded_tx_hash) << 1
+            | bool(self.safe_funded)
+        )
+
     def status(self):
-        if self.safe_deployed:
-            return "DEPLOYED"
-        elif self.safe_deployed_tx_hash:
-            return "DEPLOYED_UNCHECKED"
-        elif self.deployer_funded:
-            return "DEPLOYER_FUNDED"
-        elif self.deployer_funded_tx_hash:
-            return "DEPLOYER_FUNDED_UNCHECKED"
-        elif self.safe_funded:
-            return "DEPLOYER_NOT_FUNDED_SAFE_WITH_BALANCE"
-        else:
-            return "SAFE_WITHOUT_BALANCE"
+        return _SAFE_FUNDING_STATUS_TABLE[self._status_key()][0]
 
     def __str__(self):
-        s = "Safe %s - " % self.safe.address
-        if self.safe_deployed:
-            s += "deployed"
-        elif self.safe_deployed_tx_hash:
-            s += "deployed but not checked"
-        elif self.deployer_funded:
-            s += "with deployer funded"
-        elif self.deployer_funded_tx_hash:
-            s += "with deployer funded but not checked"
-        elif self.safe_funded:
-            s += "has enough balance, but deployer is not funded yet"
-        else:
-            s = "Safe %s" % self.safe.address
-        return s
+        description = _SAFE_FUNDING_STATUS_TABLE[self._status_key()][1]
+        if description:
+            return "Safe %s - %s" % (self.safe_id, description)
+        return "Safe %s" % self.safe_id
+
+
+# (status, description) by priority. Most significant bit set on `SafeFunding._status_key` wins
+_SAFE_FUNDING_STATUSES = (
+    ("DEPLOYED", "deployed"),
+    ("DEPLOYED_UNCHECKED", "deployed but not checked"),
+    ("DEPLOYER_FUNDED", "with deployer funded"),
+    ("DEPLOYER_FUNDED_UNCHECKED", "with deployer funded but not checked"),
+    (
+        "DEPLOYER_NOT_FUNDED_SAFE_WITH_BALANCE",
+        "has enough balance, but deployer is not funded yet",
+    ),
+)
+_SAFE_FUNDING_STATUS_TABLE = tuple(
+    (
+        _SAFE_FUNDING_STATUSES[5 - key.bit_length()]
+        if key
+        else ("SAFE_WITHOUT_BALANCE", None)
+    )
+    for key in range(32)
+)
 
 
 class EthereumBlockManager(models.Manager):
@@ -320,19 +348,28 @@ class EthereumBlock(models.Model):
 
 
 class EthereumTxManager(models.Manager):
-    def create_from_tx_dict(
+    def _build_from_tx_dict(
         self,
         tx: Dict[str, Any],
         tx_hash: Union[bytes, str],
         tx_receipt: Optional[Dict[str, Any]] = None,
         ethereum_block: Optional[EthereumBlock] = None,
     ) -> "EthereumTx":
-        data = HexBytes(tx.get("data") or tx.get("input"))
+        data = tx.get("data") or tx.get("input")
+        # Avoid `HexBytes` overhead, txs can be built in bulk
+        if isinstance(data, str):
+            if data.startswith(("0x", "0X")):
+                data = data[2:]
+            if len(data) % 2:  # Left pad odd length hex, as `HexBytes` does
+                data = "0" + data
+            data = bytes.fromhex(data)
+        else:
+            data = bytes(data)
         # Supporting EIP1559
         max_fee_per_gas = tx.get("maxFeePerGas", 0)
         max_priority_fee_per_gas = tx.get("maxPriorityFeePerGas", 0)
         gas_price = tx.get("gasPrice", max_fee_per_gas)
-        return super().create(
+        return self.model(
             block=ethereum_block,
             tx_hash=tx_hash,
             _from=tx["from"],
@@ -349,6 +386,49 @@ class EthereumTxManager(models.Manager):
             max_priority_fee_per_gas=max_priority_fee_per_gas,
         )
 
+    def create_from_tx_dict(
+        self,
+        tx: Dict[str, Any],
+        tx_hash: Union[bytes, str],
+        tx_receipt: Optional[Dict[str, Any]] = None,
+        ethereum_block: Optional[EthereumBlock] = None,
+    ) -> "EthereumTx":
+        ethereum_tx = self._build_from_tx_dict(
+            tx, tx_hash, tx_receipt=tx_receipt, ethereum_block=ethereum_block
+        )
+        ethereum_tx.save(force_insert=True, using=self.db)
+        return ethereum_tx
+
+    def bulk_create_from_tx_dicts(
+        self,
+        txs: Sequence[
+            Tuple[
+                Dict[str, Any],
+                Union[bytes, str],
+                Optional[Dict[str, Any]],
+                Optional[EthereumBlock],
+            ]
+        ],
+        batch_size: int = 500,
+    ) -> List["EthereumTx"]:
+        """
+        Insert multiple txs using `batch_size` rows per `INSERT`. Txs already stored are ignored
+
+        :param txs: Sequence of `(tx, tx_hash, tx_receipt, ethereum_block)`
+        :param batch_size: Number of txs to insert per query
+        :return: List of `EthereumTx` built
+        """
+        ethereum_txs = [
+            self._build_from_tx_dict(
+                tx, tx_hash, tx_receipt=tx_receipt, ethereum_block=ethereum_block
+            )
+            for tx, tx_hash, tx_receipt, ethereum_block in txs
+        ]
+        with transaction.atomic(using=self.db):
+            return self.bulk_create(
+                ethereum_txs, batch_size=batch_size, ignore_conflicts=True
+            )
+
 
 class EthereumTx(TimeStampedModel):
     objects = EthereumTxManager()
@@ -420,14 +500,13 @@ class SafeMultisigTxManager(models.Manager):
         :param safe_address:
         :return:
         """
-        nonce_dict = (
+        return (
             self.filter(safe=safe_address)
             .not_failed()
             .order_by("-nonce")
-            .values("nonce")
+            .values_list("nonce", flat=True)
             .first()
         )
-        return nonce_dict["nonce"] if nonce_dict else None
 
     def get_average_execution_time(
         self, from_date: datetime.datetime, to_date: datetime.datetime
@@ -562,9 +641,7 @@ class SafeMultisigTx(TimeStampedModel):
     to = EthereumAddressField(null=True, blank=True, db_index=True)
     value = Uint256Field()
     data = models.BinaryField(null=True, blank=True)
-    operation = models.PositiveSmallIntegerField(
-        choices=[(tag.value, tag.name) for tag in SafeOperation]
-    )
+    operation = models.PositiveSmallIntegerField(choices=SAFE_OPERATION_CHOICES)
     safe_tx_gas = Uint256Field()
     data_gas = Uint256Field()
     gas_price = Uint256Field()
@@ -574,11 +651,17 @@ class SafeMultisigTx(TimeStampedModel):
     nonce = Uint256Field()
     safe_tx_hash = Sha3HashField(unique=True, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["safe", "-nonce"], name="smtx_safe_nonce_idx"),
+        ]
+
     def __str__(self):
+        # Foreign keys are the tx hash and the Safe address, no need to fetch the related rows
         return "{} - {} - Safe {}".format(
-            self.ethereum_tx.tx_hash,
+            self.ethereum_tx_id,
             SafeOperation(self.operation).name,
-            self.safe.address,
+            self.safe_id,
         )
 
     def get_safe_tx(self, ethereum_client: EthereumClient) -> SafeTx:
@@ -655,7 +738,7 @@ class SafeTxStatus(models.Model):
         return (
             "Safe {} - Initial-block-number={} - "
             "Tx-block-number={} - Erc20-block-number={}".format(
-                self.safe.address,
+                self.safe_id,
                 self.initial_block_number,
                 self.tx_block_number,
                 self.erc_20_block_number,
@@ -14,7 +14,9 @@ class RedisRepository:
         return cls.instance
 
     def __init__(self):
-        self.redis = Redis.from_url(settings.REDIS_URL)
+        # `__init__` runs on every `RedisRepository()`, build the connection pool just once
+        if not hasattr(self, "redis"):
+            self.redis = Redis.from_url(settings.REDIS_URL)
 
     def nonce_lock(
         self,
@@ -10,8 +10,15 @@ from pytz import utc
 
 from gnosis.eth.constants import NULL_ADDRESS
 
-from ..models import EthereumEvent, SafeContract, SafeFunding, SafeMultisigTx
+from ..models import (
+    EthereumEvent,
+    EthereumTx,
+    SafeContract,
+    SafeFunding,
+    SafeMultisigTx,
+)
 from .factories import (
+    EthereumBlockFactory,
     EthereumEventFactory,
     EthereumTxFactory,
     SafeContractFactory,
@@ -94,6 +101,24 @@ class TestSafeContractModel(TestCase):
         )
 
 
+class TestSafeFundingModel(TestCase):
+    def test_status(self):
+        safe_funding = SafeFundingFactory()
+        self.assertEqual(safe_funding.status(), "SAFE_WITHOUT_BALANCE")
+        self.assertEqual(str(safe_funding), f"Safe {safe_funding.safe_id}")
+        safe_funding.safe_funded = True
+        self.assertEqual(safe_funding.status(), "DEPLOYER_NOT_FUNDED_SAFE_WITH_BALANCE")
+        safe_funding.deployer_funded_tx_hash = "0xabcd"
+        self.assertEqual(safe_funding.status(), "DEPLOYER_FUNDED_UNCHECKED")
+        safe_funding.deployer_funded = True
+        self.assertEqual(safe_funding.status(), "DEPLOYER_FUNDED")
+        safe_funding.safe_deployed_tx_hash = "0xabcd"
+        self.assertEqual(safe_funding.status(), "DEPLOYED_UNCHECKED")
+        safe_funding.safe_deployed = True
+        self.assertEqual(safe_funding.status(), "DEPLOYED")
+        self.assertEqual(str(safe_funding), f"Safe {safe_funding.safe_id} - deployed")
+
+
 class TestEthereumEventModel(TestCase):
     def test_ethereum_event(self):
         self.assertEqual(EthereumEvent.objects.count(), 0)
@@ -112,6 +137,79 @@ class TestEthereumEventModel(TestCase):
         self.assertTrue(EthereumEvent.objects.erc721_events().get().is_erc721())
 
 
+class TestEthereumTxModel(TestCase):
+    def test_bulk_create_from_tx_dicts(self):
+        def build_tx(nonce: int):
+            return {
+                "from": Account.create().address,
+                "gas": 21000,
+                "gasPrice": 1,
+                "data": "0x",
+                "nonce": nonce,
+                "to": Account.create().address,
+                "value": 5,
+            }
+
+        txs = [
+            (build_tx(nonce), HexBytes(Account.create().key).hex(), None, None)
+            for nonce in range(5)
+        ]
+        self.assertEqual(
+            len(EthereumTx.objects.bulk_create_from_tx_dicts(txs, batch_size=2)), 5
+        )
+        self.assertEqual(EthereumTx.objects.count(), 5)
+
+        # Already inserted txs are ignored
+        EthereumTx.objects.bulk_create_from_tx_dicts(txs)
+        self.assertEqual(EthereumTx.objects.count(), 5)
+        ethereum_tx = EthereumTx.objects.get(tx_hash=txs[3][1])
+        self.assertEqual(ethereum_tx.nonce, 3)
+        self.assertIsNone(ethereum_tx.data)
+        self.assertIsNone(ethereum_tx.status)
+
+        # Receipts and blocks are stored per tx
+        ethereum_blocks = [EthereumBlockFactory(), EthereumBlockFactory()]
+        txs = [
+            (
+                build_tx(nonce),
+                HexBytes(Account.create().key).hex(),
+                {"gasUsed": 21000 + nonce, "status": 1, "transactionIndex": nonce},
+                ethereum_block,
+            )
+            for nonce, ethereum_block in enumerate(ethereum_blocks)
+        ]
+        EthereumTx.objects.bulk_create_from_tx_dicts(txs)
+        for nonce, (_, tx_hash, _, ethereum_block) in enumerate(txs):
+            ethereum_tx = EthereumTx.objects.get(tx_hash=tx_hash)
+            self.assertEqual(ethereum_tx.block_id, ethereum_block.number)
+            self.assertEqual(ethereum_tx.gas_used, 21000 + nonce)
+            self.assertEqual(ethereum_tx.status, 1)
+            self.assertEqual(ethereum_tx.transaction_index, nonce)
+            self.assertTrue(ethereum_tx.success)
+
+    def test_create_from_tx_dict_data(self):
+        tx = {
+            "from": Account.create().address,
+            "gas": 21000,
+            "gasPrice": 1,
+            "nonce": 0,
+            "to": Account.create().address,
+            "value": 0,
+        }
+        for data, expected in (
+            ("0xabcd", b"\xab\xcd"),
+            ("0XABCD", b"\xab\xcd"),
+            ("0xabc", b"\x0a\xbc"),
+            (HexBytes("0xabcd"), b"\xab\xcd"),
+        ):
+            with self.subTest(data=data):
+                ethereum_tx = EthereumTx.objects.create_from_tx_dict(
+                    dict(tx, data=data), HexBytes(Account.create().key).hex()
+                )
+                ethereum_tx.refresh_from_db()
+                self.assertEqual(bytes(ethereum_tx.data), expected)
+
+
 class TestSafeMultisigTxModel(TestCase):
     def test_ethereum_tx_hex(self):
         multisig_tx = SafeMultisigTxFactory()
@@ -3,7 +3,7 @@ from django.test import TestCase
 
 from gnosis.eth.utils import get_eth_address_with_key
 
-from ..validators import validate_checksumed_address
+from ..validators import is_checksum_address, validate_checksumed_address
 
 
 class TestValidators(TestCase):
@@ -15,3 +15,14 @@ class TestValidators(TestCase):
         self.assertRaises(
             ValidationError, validate_checksumed_address, eth_address.lower()
         )
+
+    def test_is_checksum_address(self):
+        eth_address, _ = get_eth_address_with_key()
+
+        self.assertTrue(is_checksum_address(eth_address))
+        self.assertTrue(is_checksum_address(eth_address))  # Cached
+        self.assertFalse(is_checksum_address(eth_address.lower()))
+        self.assertFalse(is_checksum_address(eth_address[:-1]))
+        self.assertFalse(is_checksum_address("0x" + "z" * 40))
+        self.assertFalse(is_checksum_address(eth_address + "\n"))
+        self.assertFalse(is_checksum_address(None))
@@ -1,7 +1,30 @@
+import re
+from functools import lru_cache
+
 from django.core.exceptions import ValidationError
 
 from web3 import Web3
 
+ETHEREUM_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
+@lru_cache(maxsize=4096)
+def _to_checksum_address(address_lower: str) -> str:
+    return Web3.toChecksumAddress(address_lower)
+
+
+def is_checksum_address(address: str) -> bool:
+    """
+    Same as `Web3.isChecksumAddress`, but malformed addresses are rejected without hashing and
+    checksums are cached, so addresses checked often don't need to be hashed again
+
+    :param address:
+    :return: `True` if `address` is a valid checksummed address, `False` otherwise
+    """
+    if not isinstance(address, str) or not ETHEREUM_ADDRESS_RE.fullmatch(address):
+        return False
+    return _to_checksum_address(address.lower()) == address
+
 
 def validate_checksumed_address(address):
     if not Web3.isChecksumAddress(address):
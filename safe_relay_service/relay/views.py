@@ -49,6 +49,7 @@ from .services.transaction_service import (
     TransactionServiceProvider,
 )
 from .tasks import fund_deployer_task
+from .validators import is_checksum_address
 
 logger = logging.getLogger(__name__)
 
@@ -271,7 +272,7 @@ class SafeSignalView(APIView):
         """
         Get status of the safe creation
         """
-        if not Web3.isChecksumAddress(address):
+        if not is_checksum_address(address):
             return Response(status=status.HTTP_422_UNPROCESSABLE_ENTITY)
         else:
             try:
@@ -294,12 +295,10 @@ class SafeSignalView(APIView):
         """
         Force check of a safe balance to start the safe creation
         """
-        if not Web3.isChecksumAddress(address):
+        if not is_checksum_address(address):
             return Response(status=status.HTTP_422_UNPROCESSABLE_ENTITY)
         else:
-            try:
-                SafeContract.objects.get(address=address)
-            except SafeContract.DoesNotExist:
+            if not SafeContract.objects.filter(address=address).exists():
                 return Response(status=status.HTTP_404_NOT_FOUND)
 
             fund_deployer_task.delay(address)
@@ -25,6 +25,7 @@ from .serializers import (
 )
 from .services.safe_creation_service import SafeCreationV1_0_0ServiceProvider
 from .tasks import deploy_create2_safe_task
+from .validators import is_checksum_address
 
 logger = getLogger(__name__)
 
@@ -97,20 +98,20 @@ class SafeCreationView(CreateAPIView):
             safe_creation = safe_creation_service.create2_safe_tx(
                 salt_nonce, owners, threshold, payment_token
             )
+            # Data comes from the service, serialize it without validating it again
             safe_creation_response_data = SafeCreation2ResponseSerializer(
-                data={
+                {
                     "safe": safe_creation.safe.address,
                     "master_copy": safe_creation.master_copy,
                     "proxy_factory": safe_creation.proxy_factory,
                     "payment": safe_creation.payment,
                     "payment_token": safe_creation.payment_token or NULL_ADDRESS,
                     "payment_receiver": safe_creation.payment_receiver or NULL_ADDRESS,
-                    "setup_data": HexBytes(safe_creation.setup_data).hex(),
+                    "setup_data": HexBytes(safe_creation.setup_data),
                     "gas_estimated": safe_creation.gas_estimated,
                     "gas_price_estimated": safe_creation.gas_price_estimated,
                 }
             )
-            safe_creation_response_data.is_valid(raise_exception=True)
             return Response(
                 status=status.HTTP_201_CREATED, data=safe_creation_response_data.data
             )
@@ -175,7 +176,7 @@ class SafeSignalView(APIView):
         """
         Get status of the safe creation
         """
-        if not Web3.isChecksumAddress(address):
+        if not is_checksum_address(address):
             return Response(status=status.HTTP_422_UNPROCESSABLE_ENTITY)
         else:
             try:
@@ -196,12 +197,10 @@ class SafeSignalView(APIView):
         """
         Force check of a safe balance to start the safe creation
         """
-        if not Web3.isChecksumAddress(address):
+        if not is_checksum_address(address):
             return Response(status=status.HTTP_422_UNPROCESSABLE_ENTITY)
         else:
-            try:
-                SafeCreation2.objects.get(safe=address)
-            except SafeCreation2.DoesNotExist:
+            if not SafeCreation2.objects.filter(safe=address).exists():
                 return Response(status=status.HTTP_404_NOT_FOUND)
 
             deploy_create2_safe_task.delay(address)
@@ -86,20 +86,20 @@ class SafeCreationView(CreateAPIView):
             safe_creation = safe_creation_service.create2_safe_tx(
                 salt_nonce, owners, threshold, payment_token
             )
+            # Data comes from the service, serialize it without validating it again
             safe_creation_response_data = SafeCreation2ResponseSerializer(
-                data={
+                {
                     "safe": safe_creation.safe.address,
                     "master_copy": safe_creation.master_copy,
                     "proxy_factory": safe_creation.proxy_factory,
                     "payment": safe_creation.payment,
                     "payment_token": safe_creation.payment_token or NULL_ADDRESS,
                     "payment_receiver": safe_creation.payment_receiver or NULL_ADDRESS,
-                    "setup_data": HexBytes(safe_creation.setup_data).hex(),
+                    "setup_data": HexBytes(safe_creation.setup_data),
                     "gas_estimated": safe_creation.gas_estimated,
                     "gas_price_estimated": safe_creation.gas_price_estimated,
                 }
             )
-            safe_creation_response_data.is_valid(raise_exception=True)
             return Response(
                 status=status.HTTP_201_CREATED, data=safe_creation_response_data.data
             )
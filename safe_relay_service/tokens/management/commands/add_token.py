@@ -26,42 +26,59 @@ class Command(BaseCommand):
         no_prompt = options["no_prompt"]
         ethereum_client = EthereumClientProvider()
 
-        for token_address in tokens:
-            token_address = ethereum_client.w3.toChecksumAddress(token_address)
-            try:
-                token = Token.objects.get(address=token_address)
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"Token {token.name} - {token.symbol} with address "
-                        f"{token_address} already exists"
-                    )
-                )
-                continue
-            except Token.DoesNotExist:
-                pass
-            try:
-                info = ethereum_client.erc20.get_info(token_address)
-                if no_prompt:
-                    response = "y"
-                else:
-                    response = (
-                        input(f"Do you want to create a token {info} (y/n) ")
-                        .strip()
-                        .lower()
-                    )
-                if response == "y":
-                    Token.objects.create(
-                        address=token_address,
-                        name=info.name,
-                        symbol=info.symbol,
-                        decimals=info.decimals,
+        # Remove duplicated addresses keeping the order
+        token_addresses = list(
+            dict.fromkeys(
+                ethereum_client.w3.toChecksumAddress(token_address)
+                for token_address in tokens
+            )
+        )
+        # Fetch every existing token in one query instead of one per address
+        existing_tokens = Token.objects.in_bulk(token_addresses)
+        tokens_to_create = []
+        try:
+            for token_address in token_addresses:
+                token = existing_tokens.get(token_address)
+                if token:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"Token {token.name} - {token.symbol} with address "
+                            f"{token_address} already exists"
+                        )
                     )
+                    continue
+                try:
+                    info = ethereum_client.erc20.get_info(token_address)
+                    if no_prompt:
+                        response = "y"
+                    else:
+                        response = (
+                            input(f"Do you want to create a token {info} (y/n) ")
+                            .strip()
+                            .lower()
+                        )
+                    if response == "y":
+                        tokens_to_create.append(
+                            Token(
+                                address=token_address,
+                                name=info.name,
+                                symbol=info.symbol,
+                                decimals=info.decimals,
+                            )
+                        )
+                except InvalidERC20Info:
                     self.stdout.write(
-                        self.style.SUCCESS(
-                            f"Created token {info.name} on address {token_address}"
+                        self.style.ERROR(
+                            f"Token with address {token_address} is not valid"
                         )
                     )
-            except InvalidERC20Info:
+        finally:
+            # Store confirmed tokens even if a later one fails (RPC error, aborted prompt...)
+            # Existing tokens were filtered out, so every token is inserted
+            Token.objects.bulk_create(tokens_to_create)
+            for token in tokens_to_create:
                 self.stdout.write(
-                    self.style.ERROR(f"Token with address {token_address} is not valid")
+                    self.style.SUCCESS(
+                        f"Created token {token.name} on address {token.address}"
+                    )
                 )
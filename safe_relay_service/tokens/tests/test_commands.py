@@ -1,4 +1,5 @@
 from io import StringIO
+from unittest import mock
 
 from django.core.management import call_command
 from django.test import TestCase
@@ -6,8 +7,10 @@ from django.test import TestCase
 from eth_account import Account
 
 from gnosis.eth import EthereumClientProvider
+from gnosis.eth.ethereum_client import Erc20Info, Erc20Manager
 from gnosis.eth.tests.utils import deploy_example_erc20
 
+from ..models import Token
 from .factories import TokenFactory
 
 
@@ -22,3 +25,50 @@ class TestCommands(TestCase):
         erc20 = deploy_example_erc20(ethereum_client.w3, 10, Account.create().address)
         call_command("add_token", erc20.address, "--no-prompt", stdout=buf)
         self.assertIn("Created token", buf.getvalue())
+
+    def test_add_token_multiple(self):
+        token = TokenFactory()
+        ethereum_client = EthereumClientProvider()
+        erc20 = deploy_example_erc20(ethereum_client.w3, 10, Account.create().address)
+        buf = StringIO()
+        call_command(
+            "add_token", token.address, erc20.address, "--no-prompt", stdout=buf
+        )
+        self.assertIn("already exists", buf.getvalue())
+        self.assertIn("Created token", buf.getvalue())
+        self.assertEqual(Token.objects.count(), 2)
+
+    def test_add_token_duplicated(self):
+        ethereum_client = EthereumClientProvider()
+        erc20 = deploy_example_erc20(ethereum_client.w3, 10, Account.create().address)
+        buf = StringIO()
+        call_command(
+            "add_token",
+            erc20.address,
+            erc20.address.lower(),
+            "--no-prompt",
+            stdout=buf,
+        )
+        self.assertEqual(buf.getvalue().count("Created token"), 1)
+        self.assertEqual(Token.objects.count(), 1)
+
+    @mock.patch.object(
+        Erc20Manager,
+        "get_info",
+        autospec=True,
+        side_effect=[Erc20Info("Test Token", "TT", 18), ConnectionError],
+    )
+    def test_add_token_error(self, get_info_mock: mock.MagicMock):
+        token_address = Account.create().address
+        buf = StringIO()
+        with self.assertRaises(ConnectionError):
+            call_command(
+                "add_token",
+                token_address,
+                Account.create().address,
+                "--no-prompt",
+                stdout=buf,
+            )
+        # Token confirmed before the error is stored
+        self.assertIn("Created token", buf.getvalue())
+        self.assertEqual(Token.objects.get().address, token_address)